@@ -10,7 +10,7 @@ from typing import List, Dict, Optional
 import logging
 from urllib.parse import urljoin
 
-from utils.http_client import HTTPClient
+from utils.http_client import HTTPClient, get_default_client, elapsed_seconds
 from utils.progress_bar import ProgressBar
 
 
@@ -27,7 +27,7 @@ class DirectoryScanner:
         self.base_url = base_url.rstrip('/')
         self.wordlist = wordlist
         self.threads = min(threads, 200)  # Cap at 200 threads
-        self.client = http_client or HTTPClient()
+        self.client = http_client or get_default_client()
         self.logger = logger or logging.getLogger(__name__)
         
         # Statistics
@@ -118,7 +118,7 @@ class DirectoryScanner:
                     'content_length': len(response.content),
                     'headers': dict(response.headers),
                     'title': self._extract_title(response.text),
-                    'response_time': response.elapsed
+                    'response_time': elapsed_seconds(response)
                 }
         
         except Exception as e:
@@ -3,486 +3,491 @@ Professional report generator for NIDHZ
 """
 
 import os
+import io
 import json
 import csv
-from datetime import datetime
-from typing import Dict, List, Any
-import html
+import errno
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple, Union
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
+
+from utils.helpers import ensure_dir
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import liburing
+except ImportError:  # optional dependency, Linux only
+    liburing = None
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# Report output buffering
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MB
+STREAM_BUFFER_ITEMS = 64
+CSV_BUFFER_SIZE = 4 * 1024 * 1024  # 4 MB
+
+# Single CSV report: every row is tagged with its section, unused columns are left empty
+REPORT_CSV_HEADER = [
+    'Section', 'Type', 'Subtype', 'URL', 'Parameter', 'Payload', 'Status',
+    'Size', 'Title', 'Response Time', 'Confidence', 'Database', 'Evidence'
+]
+# Result keys for the columns between Section and Evidence
+REPORT_CSV_FIELDS = (
+    'type', 'subtype', 'url', 'parameter', 'payload', 'status_code',
+    'content_length', 'title', 'response_time', 'confidence', 'database'
+)
+EVIDENCE_MAX_LENGTH = 500
+
+# O_DIRECT writes must use aligned buffers and block-multiple lengths
+DIRECT_IO_CHUNK_SIZE = 1 << 20  # 1 MB
+DIRECT_IO_ALIGNMENT = 4096
+
+# Submission queue depth for batched io_uring report writes
+IO_URING_QUEUE_DEPTH = 8
+
+# Markdown section text for scans without findings
+MD_NO_XSS = "No XSS vulnerabilities found.\n"
+MD_NO_SQLI = "No SQL injection vulnerabilities found.\n"
+
+# Both vulnerability sections of a clean scan, prebuilt so it skips per-section rendering
+MD_CLEAN_FINDINGS = (
+    f"## 🔍 XSS Vulnerabilities\n\n{MD_NO_XSS}\n\n"
+    f"## 💉 SQL Injection Vulnerabilities\n\n{MD_NO_SQLI}"
+)
+
+# Confidence level -> (CSS class, badge label) for vulnerability cards
+CONFIDENCE_BADGES: Dict[str, Tuple[str, str]] = {
+    'high': ('high', 'HIGH'),
+    'medium': ('medium', 'MEDIUM'),
+    'low': ('low', 'LOW')
+}
+
+
+def _load_static(filename: str) -> Markup:
+    """Read a static report asset from the template directory"""
+    with open(os.path.join(TEMPLATE_DIR, filename), 'r', encoding='utf-8') as f:
+        return Markup(f.read().rstrip('\n'))
+
+
+# Static CSS/JS boilerplate, read once and emitted verbatim into every report
+_CSS = _load_static('report.css')
+_SCRIPT = _load_static('report.js')
+
+
+_ICON_SUCCESS = Markup('<i class="fas fa-check-circle" style="color: #68d391"></i>')
+_ICON_REDIRECT = Markup('<i class="fas fa-exchange-alt" style="color: #f6ad55"></i>')
+_ICON_CLIENT_ERROR = Markup('<i class="fas fa-lock" style="color: #fc8181"></i>')
+_ICON_SERVER_ERROR = Markup('<i class="fas fa-exclamation-circle" style="color: #764ba2"></i>')
+_ICON_UNKNOWN = Markup('<i class="fas fa-question-circle" style="color: #a0aec0"></i>')
+
+# Status code -> icon, indexed directly for codes below 600
+_ICON_TABLE = (
+    [_ICON_UNKNOWN] * 200
+    + [_ICON_SUCCESS] * 100
+    + [_ICON_REDIRECT] * 100
+    + [_ICON_CLIENT_ERROR] * 100
+    + [_ICON_SERVER_ERROR] * 100
+)
+
+
+def _status_icon(status_code: int) -> Markup:
+    """Get Font Awesome icon for status code"""
+    if 0 <= status_code < 600:
+        return _ICON_TABLE[status_code]
+    return _ICON_SERVER_ERROR if status_code >= 600 else _ICON_UNKNOWN
+
+
+def _clean_value(value: Any) -> Any:
+    """Convert a value into JSON-serializable form"""
+    converter = _JSON_CONVERTERS.get(type(value))
+    return converter(value) if converter is not None else value
+
+
+def _clean_dict(data: Dict) -> Dict:
+    """Clean every value of a dict, stringifying non-string keys"""
+    return {
+        (key if type(key) is str else str(key)): _clean_value(value)
+        for key, value in data.items()
+    }
+
+
+def _clean_sequence(items: Iterable) -> List:
+    """Clean every item of a list, tuple or set"""
+    return [_clean_value(item) for item in items]
+
+
+def _decode_bytes(data: Union[bytes, bytearray]) -> str:
+    """Decode raw bytes for the JSON report"""
+    return data.decode('utf-8', errors='replace')
+
+
+# Exact type -> converter; one dict lookup replaces an isinstance() chain per value.
+# Anything not listed is passed through and left to the serializer's default=str.
+_JSON_CONVERTERS = {
+    dict: _clean_dict,
+    list: _clean_sequence,
+    tuple: _clean_sequence,
+    set: _clean_sequence,
+    frozenset: _clean_sequence,
+    bytes: _decode_bytes,
+    bytearray: _decode_bytes,
+    datetime: datetime.isoformat,
+    timedelta: timedelta.total_seconds
+}
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def _write_all_direct(fd: int, block: memoryview, filepath: str):
+    """Write an aligned block in full, failing loudly rather than leaving a zero-padded hole"""
+    written = 0
+    while written < len(block):
+        with block[written:] as remaining:
+            n = os.write(fd, remaining)
+        # A partial write that breaks block alignment can't be resumed with O_DIRECT
+        if n <= 0 or (n % DIRECT_IO_ALIGNMENT and written + n < len(block)):
+            raise OSError(errno.EIO, f"Short O_DIRECT write ({written + max(n, 0)} of {len(block)} bytes)", filepath)
+        written += n
+
+
+def _write_direct(filepath: str, data: bytes):
+    """Write data to filepath with O_DIRECT, bypassing the page cache"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    try:
+        # Anonymous mmap memory is page-aligned, as O_DIRECT requires
+        buffer = mmap.mmap(-1, DIRECT_IO_CHUNK_SIZE)
+        try:
+            data_view = memoryview(data)
+            with memoryview(buffer) as buffer_view:
+                for offset in range(0, len(data), DIRECT_IO_CHUNK_SIZE):
+                    chunk = data_view[offset:offset + DIRECT_IO_CHUNK_SIZE]
+                    size = len(chunk)
+                    buffer_view[:size] = chunk
+                    
+                    # Pad the final chunk to a whole block; the file is trimmed below
+                    padded = -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+                    buffer_view[size:padded] = bytes(padded - size)
+                    with buffer_view[:padded] as block:
+                        _write_all_direct(fd, block, filepath)
+        finally:
+            buffer.close()
+        
+        os.ftruncate(fd, len(data))
+    finally:
+        os.close(fd)
+
+
+def _encode_csv(header: List[str], rows: Iterable[List[Any]]) -> bytes:
+    """Render a CSV table in memory as UTF-8 bytes"""
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def _report_csv_rows(section: str, items: List[Dict]) -> Iterator[List[Any]]:
+    """Yield rows of the combined CSV report for one result section"""
+    for item in items:
+        row = [section]
+        row.extend(item.get(key, '') for key in REPORT_CSV_FIELDS)
+        row.append(_truncate_evidence(item.get('evidence', '')))
+        yield row
+
+
+def _truncate_evidence(evidence: Union[str, bytes, bytearray]) -> str:
+    """Truncate evidence for CSV output, decoding only the kept bytes"""
+    if isinstance(evidence, (bytes, bytearray)):
+        return evidence[:EVIDENCE_MAX_LENGTH].decode('utf-8', errors='replace')
+    return evidence[:EVIDENCE_MAX_LENGTH]
 
 
 class Reporter:
     """Generates multiple report formats"""
     
-    def __init__(self, output_dir: str = "reports"):
+    # Shared by all instances so templates are compiled only once per process
+    _environment: Optional[Environment] = None
+    
+    def __init__(self, output_dir: str = "reports", use_odirect: bool = False, use_io_uring: bool = False):
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        # Bypass the page cache for large JSON/CSV reports (Linux only)
+        self.use_odirect = use_odirect and hasattr(os, 'O_DIRECT')
+        # Submit the JSON/CSV/Markdown writes as one io_uring batch (requires liburing)
+        self.use_io_uring = use_io_uring and liburing is not None
+        ensure_dir(output_dir)
+        
+        self._env = self._get_environment()
+        self._template = self._env.get_template('report.html.j2')
     
-    def generate_html_report(self, results: Dict[str, Any]):
-        """Generate interactive HTML report"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    @classmethod
+    def _get_environment(cls) -> Environment:
+        """Get the shared Jinja2 environment, creating it on first use"""
+        if cls._environment is None:
+            env = Environment(
+                loader=FileSystemLoader(TEMPLATE_DIR),
+                autoescape=True,
+                auto_reload=False,
+                trim_blocks=True,
+                lstrip_blocks=True
+            )
+            env.filters['status_icon'] = _status_icon
+            env.globals['report_css'] = _CSS
+            env.globals['report_script'] = _SCRIPT
+            env.globals['confidence_badges'] = CONFIDENCE_BADGES
+            cls._environment = env
+        return cls._environment
+    
+    def generate_all(self, results: Dict[str, Any]):
+        """Generate every report format concurrently"""
+        # One timestamp for the whole batch keeps the reports consistent
+        now = datetime.now()
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>NIDHZ Security Scan Report - {results['target']}</title>
-            <style>
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                body {{ 
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                    line-height: 1.6; 
-                    color: #333; 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                }}
-                
-                .container {{ 
-                    max-width: 1200px; 
-                    margin: 0 auto; 
-                    padding: 20px;
-                }}
-                
-                .report-card {{
-                    background: white;
-                    border-radius: 20px;
-                    box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                    overflow: hidden;
-                    margin: 40px auto;
-                }}
-                
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 40px;
-                    text-align: center;
-                }}
-                
-                .header h1 {{
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 15px;
-                }}
-                
-                .header .logo {{
-                    font-size: 2em;
-                }}
-                
-                .summary {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                    gap: 20px;
-                    padding: 30px;
-                    background: #f8f9fa;
-                }}
-                
-                .summary-card {{
-                    background: white;
-                    padding: 25px;
-                    border-radius: 15px;
-                    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-                    text-align: center;
-                    transition: transform 0.3s;
-                }}
-                
-                .summary-card:hover {{
-                    transform: translateY(-5px);
-                }}
-                
-                .summary-card h3 {{
-                    color: #667eea;
-                    margin-bottom: 15px;
-                    font-size: 1.1em;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                }}
-                
-                .summary-card .number {{
-                    font-size: 2.5em;
-                    font-weight: bold;
-                    color: #764ba2;
-                    margin: 10px 0;
-                }}
-                
-                .section {{
-                    padding: 30px;
-                    border-bottom: 1px solid #eee;
-                }}
-                
-                .section:last-child {{
-                    border-bottom: none;
-                }}
-                
-                .section h2 {{
-                    color: #667eea;
-                    margin-bottom: 20px;
-                    padding-bottom: 10px;
-                    border-bottom: 3px solid #764ba2;
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                
-                .tech-badges {{
-                    display: flex;
-                    flex-wrap: wrap;
-                    gap: 10px;
-                    margin: 20px 0;
-                }}
-                
-                .tech-badge {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 8px 20px;
-                    border-radius: 50px;
-                    font-size: 0.9em;
-                    font-weight: 500;
-                }}
-                
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }}
-                
-                th {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 15px;
-                    text-align: left;
-                }}
-                
-                td {{
-                    padding: 12px 15px;
-                    border-bottom: 1px solid #eee;
-                }}
-                
-                tr:hover {{
-                    background: #f8f9fa;
-                }}
-                
-                .vuln-card {{
-                    background: #fff5f5;
-                    border-left: 4px solid #fc8181;
-                    padding: 20px;
-                    margin: 15px 0;
-                    border-radius: 10px;
-                }}
-                
-                .vuln-card.high {{ border-color: #fc8181; background: #fff5f5; }}
-                .vuln-card.medium {{ border-color: #f6ad55; background: #fffaf0; }}
-                .vuln-card.low {{ border-color: #68d391; background: #f0fff4; }}
-                
-                .confidence-badge {{
-                    display: inline-block;
-                    padding: 5px 15px;
-                    border-radius: 20px;
-                    font-size: 0.8em;
-                    font-weight: bold;
-                    margin-left: 10px;
-                }}
-                
-                .high-badge {{ background: #fc8181; color: white; }}
-                .medium-badge {{ background: #f6ad55; color: white; }}
-                .low-badge {{ background: #68d391; color: white; }}
-                
-                .footer {{
-                    text-align: center;
-                    padding: 30px;
-                    color: #666;
-                    font-size: 0.9em;
-                    background: #f8f9fa;
-                }}
-                
-                @media (max-width: 768px) {{
-                    .container {{ padding: 10px; }}
-                    .header {{ padding: 20px; }}
-                    .header h1 {{ font-size: 1.8em; }}
-                    table {{ display: block; overflow-x: auto; }}
-                }}
-            </style>
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-        </head>
-        <body>
-            <div class="container">
-                <div class="report-card">
-                    <!-- Header -->
-                    <div class="header">
-                        <h1>
-                            <i class="fas fa-shield-alt logo"></i>
-                            NIDHZ Security Scan Report
-                        </h1>
-                        <p>Comprehensive Web Vulnerability Assessment</p>
-                    </div>
-                    
-                    <!-- Summary Section -->
-                    <div class="summary">
-                        <div class="summary-card">
-                            <h3><i class="fas fa-target"></i> Target</h3>
-                            <p>{html.escape(results['target'])}</p>
-                        </div>
-                        
-                        <div class="summary-card">
-                            <h3><i class="fas fa-calendar"></i> Scan Date</h3>
-                            <p>{timestamp}</p>
-                        </div>
-                        
-                        <div class="summary-card">
-                            <h3><i class="fas fa-folder-open"></i> Directories Found</h3>
-                            <div class="number">{len(results['directories'])}</div>
-                        </div>
-                        
-                        <div class="summary-card">
-                            <h3><i class="fas fa-bug"></i> Vulnerabilities</h3>
-                            <div class="number">{len(results['xss_vulnerabilities']) + len(results['sqli_vulnerabilities'])}</div>
-                        </div>
-                    </div>
-                    
-                    <!-- Technology Stack -->
-                    <div class="section">
-                        <h2><i class="fas fa-microchip"></i> Technology Stack</h2>
-                        <div class="tech-badges">
-                            {''.join([f'<span class="tech-badge">{tech}</span>' for tech in results['technology']]) if results['technology'] else '<p>No specific technology detected</p>'}
-                        </div>
-                    </div>
-                    
-                    <!-- Discovered Directories -->
-                    <div class="section">
-                        <h2><i class="fas fa-sitemap"></i> Discovered Directories ({len(results['directories'])})</h2>
-                        <table>
-                            <thead>
-                                <tr>
-                                    <th>URL</th>
-                                    <th>Status</th>
-                                    <th>Size</th>
-                                    <th>Title</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                                {self._generate_directory_rows(results['directories'][:50])}
-                            </tbody>
-                        </table>
-                    </div>
-                    
-                    <!-- XSS Vulnerabilities -->
-                    {self._generate_vuln_section('XSS Vulnerabilities', results['xss_vulnerabilities'], 'fa-exclamation-triangle')}
-                    
-                    <!-- SQLi Vulnerabilities -->
-                    {self._generate_vuln_section('SQL Injection Vulnerabilities', results['sqli_vulnerabilities'], 'fa-database')}
-                    
-                    <!-- Footer -->
-                    <div class="footer">
-                        <p>Generated by <strong>NIDHZ Ultimate v2.0</strong></p>
-                        <p><i class="fas fa-exclamation-circle"></i> This report is for authorized security testing only.</p>
-                        <p>© {datetime.now().year} NIDHZ Security Team. All rights reserved.</p>
-                    </div>
-                </div>
-            </div>
-            
-            <script>
-                // Add interactivity
-                document.addEventListener('DOMContentLoaded', function() {{
-                    // Toggle vulnerability details
-                    document.querySelectorAll('.vuln-card').forEach(card => {{
-                        card.addEventListener('click', function() {{
-                            const details = this.querySelector('.vuln-details');
-                            if (details) {{
-                                details.style.display = details.style.display === 'none' ? 'block' : 'none';
-                            }}
-                        }});
-                    }});
-                    
-                    // Copy URLs on click
-                    document.querySelectorAll('td:first-child').forEach(td => {{
-                        td.style.cursor = 'pointer';
-                        td.title = 'Click to copy URL';
-                        td.addEventListener('click', function() {{
-                            navigator.clipboard.writeText(this.textContent);
-                            const original = this.textContent;
-                            this.textContent = 'Copied!';
-                            setTimeout(() => this.textContent = original, 1000);
-                        }});
-                    }});
-                }});
-            </script>
-        </body>
-        </html>
-        """
+        if self.use_io_uring:
+            self._generate_all_io_uring(results, now)
+            return
         
-        filepath = os.path.join(self.output_dir, 'report.html')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Each writer produces its own files, so they can run side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._write_html_report, results, now),
+                executor.submit(self._write_json_report, results),
+                executor.submit(self._write_csv_reports, results),
+                executor.submit(self._write_markdown_report, results, now)
+            ]
         
-        print(f"[+] HTML report generated: {filepath}")
+        # Report from this thread so worker output can't interleave, and re-raise
+        # failures only after every report has had a chance to finish
+        error = None
+        for future in futures:
+            try:
+                self._print_generated(future.result())
+            except Exception as e:
+                error = error or e
+        if error:
+            raise error
     
-    def _generate_directory_rows(self, directories: List[Dict]) -> str:
-        """Generate HTML table rows for directories"""
-        rows = []
-        for dir_info in directories:
-            status = dir_info.get('status_code', 0)
-            status_icon = self._get_status_icon(status)
-            
-            row = f"""
-            <tr>
-                <td>{html.escape(dir_info.get('url', ''))}</td>
-                <td>{status_icon} {status}</td>
-                <td>{dir_info.get('content_length', 0):,} bytes</td>
-                <td>{html.escape(dir_info.get('title', ''))[:50]}</td>
-            </tr>
-            """
-            rows.append(row)
+    def _generate_all_io_uring(self, results: Dict[str, Any], now: datetime):
+        """Stream the HTML report, then write every other report in one io_uring batch"""
+        outputs = [('JSON report', os.path.join(self.output_dir, 'report.json'), self._render_json(results))]
+        outputs.extend(
+            (label, filepath, _encode_csv(header, rows))
+            for label, filepath, header, rows in self._csv_tables(results)
+        )
+        outputs.append((
+            'Markdown report',
+            os.path.join(self.output_dir, 'report.md'),
+            self._render_markdown(results, now).encode('utf-8')
+        ))
+        
+        written = self._write_html_report(results, now)
+        self._io_uring_write_all([(filepath, data) for _, filepath, data in outputs])
         
-        return ''.join(rows)
+        written.extend((label, filepath) for label, filepath, _ in outputs)
+        self._print_generated(written)
     
-    def _generate_vuln_section(self, title: str, vulnerabilities: List[Dict], icon: str) -> str:
-        """Generate vulnerability section HTML"""
-        if not vulnerabilities:
-            return ""
+    @staticmethod
+    def _print_generated(written: List[Tuple[str, str]]):
+        """Announce each (label, path) report that was written"""
+        for label, filepath in written:
+            print(f"[+] {label} generated: {filepath}")
+    
+    def _io_uring_write_all(self, payloads: List[Tuple[str, bytes]]):
+        """Write each (path, data) pair using a single io_uring submission"""
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        try:
+            liburing.io_uring_queue_init(IO_URING_QUEUE_DEPTH, ring)
+        except OSError:
+            # io_uring unsupported or disabled on this kernel
+            for filepath, data in payloads:
+                self._write_bytes(filepath, data)
+            return
         
-        vuln_cards = []
-        for vuln in vulnerabilities:
-            confidence = vuln.get('confidence', 'low').lower()
-            confidence_badge = f'<span class="confidence-badge {confidence}-badge">{confidence.upper()}</span>'
+        fds = []
+        try:
+            for index, (filepath, data) in enumerate(payloads):
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                fds.append(fd)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, fd, data, 0)
+                liburing.io_uring_sqe_set_data64(sqe, index)
             
-            card = f"""
-            <div class="vuln-card {confidence}">
-                <h3>{vuln.get('type', 'Vulnerability')} {confidence_badge}</h3>
-                <p><strong>URL:</strong> {html.escape(vuln.get('url', ''))}</p>
-                <p><strong>Parameter:</strong> {html.escape(vuln.get('parameter', 'N/A'))}</p>
-                <p><strong>Payload:</strong> <code>{html.escape(vuln.get('payload', ''))}</code></p>
-                {f'<p><strong>Evidence:</strong><br><pre>{html.escape(vuln.get("evidence", ""))}</pre></p>' if vuln.get('evidence') else ''}
-            </div>
-            """
-            vuln_cards.append(card)
-        
-        return f"""
-        <div class="section">
-            <h2><i class="fas {icon}"></i> {title} ({len(vulnerabilities)})</h2>
-            {''.join(vuln_cards)}
-        </div>
-        """
+            liburing.io_uring_submit_and_wait(ring, len(payloads))
+            
+            pending = len(payloads)
+            while pending:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                ready = liburing.io_uring_cq_ready(ring)
+                for i in range(ready):
+                    entry = cqe[i]
+                    index = liburing.io_uring_cqe_get_data64(entry)
+                    written = entry.res
+                    filepath, data = payloads[index]
+                    if written < 0:
+                        raise OSError(-written, os.strerror(-written), filepath)
+                    
+                    # Finish short writes synchronously
+                    while written < len(data):
+                        written += os.pwrite(fds[index], data[written:], written)
+                
+                liburing.io_uring_cq_advance(ring, ready)
+                pending -= ready
+        finally:
+            for fd in fds:
+                os.close(fd)
+            liburing.io_uring_queue_exit(ring)
     
-    def _get_status_icon(self, status_code: int) -> str:
-        """Get Font Awesome icon for status code"""
-        if 200 <= status_code < 300:
-            return '<i class="fas fa-check-circle" style="color: #68d391"></i>'
-        elif 300 <= status_code < 400:
-            return '<i class="fas fa-exchange-alt" style="color: #f6ad55"></i>'
-        elif 400 <= status_code < 500:
-            return '<i class="fas fa-lock" style="color: #fc8181"></i>'
-        elif status_code >= 500:
-            return '<i class="fas fa-exclamation-circle" style="color: #764ba2"></i>'
-        else:
-            return '<i class="fas fa-question-circle" style="color: #a0aec0"></i>'
+    def generate_html_report(self, results: Dict[str, Any], now: Optional[datetime] = None):
+        """Generate interactive HTML report"""
+        self._print_generated(self._write_html_report(results, now or datetime.now()))
+    
+    def _write_html_report(self, results: Dict[str, Any], now: datetime) -> List[Tuple[str, str]]:
+        """Stream the HTML report to disk"""
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        filepath = os.path.join(self.output_dir, 'report.html')
+        stream = self._template.stream(
+            target=results['target'],
+            timestamp=timestamp,
+            year=now.year,
+            technology=results['technology'],
+            total_directories=len(results['directories']),
+            directories=results['directories'][:50],
+            xss=results['xss_vulnerabilities'],
+            sqli=results['sqli_vulnerabilities']
+        )
+        # Group template output into chunks so rows are written as they render
+        stream.enable_buffering(STREAM_BUFFER_ITEMS)
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            stream.dump(f)
+        
+        return [('HTML report', filepath)]
     
     def generate_json_report(self, results: Dict[str, Any]):
         """Generate JSON report"""
+        self._print_generated(self._write_json_report(results))
+    
+    def _write_json_report(self, results: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Write the JSON report to disk"""
         filepath = os.path.join(self.output_dir, 'report.json')
         
+        self._write_bytes(filepath, self._render_json(results))
+        
+        return [('JSON report', filepath)]
+    
+    def _render_json(self, results: Dict[str, Any]) -> bytes:
+        """Serialize scan results for the JSON report"""
         # Clean up results for JSON serialization
         clean_results = self._clean_for_json(results)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(clean_results, f, indent=2, default=str)
-        
-        print(f"[+] JSON report generated: {filepath}")
+        return _dump_json(clean_results)
     
     def generate_csv_report(self, results: Dict[str, Any]):
         """Generate CSV reports"""
-        # Directories CSV
-        if results['directories']:
-            dir_file = os.path.join(self.output_dir, 'directories.csv')
-            with open(dir_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['URL', 'Status', 'Size', 'Title', 'Response Time'])
-                
-                for dir_info in results['directories']:
-                    writer.writerow([
-                        dir_info.get('url', ''),
-                        dir_info.get('status_code', 0),
-                        dir_info.get('content_length', 0),
-                        dir_info.get('title', ''),
-                        dir_info.get('response_time', 0)
-                    ])
-            
-            print(f"[+] Directories CSV generated: {dir_file}")
+        self._print_generated(self._write_csv_reports(results))
+    
+    def _write_csv_reports(self, results: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Write the CSV reports to disk"""
+        written = []
+        for label, filepath, header, rows in self._csv_tables(results):
+            self._write_csv(filepath, header, rows)
+            written.append((label, filepath))
+        return written
+    
+    def _clean_for_json(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert scan results into JSON-serializable types"""
+        return _clean_dict(results)
+    
+    def _csv_tables(self, results: Dict[str, Any]) -> List[Tuple[str, str, List[str], Iterable[List[Any]]]]:
+        """Get (label, path, header, rows) for each CSV report to write"""
+        sections = [
+            ('directory', results['directories']),
+            ('xss', results['xss_vulnerabilities']),
+            ('sqli', results['sqli_vulnerabilities'])
+        ]
+        if not any(items for _, items in sections):
+            return []
         
-        # XSS Vulnerabilities CSV
-        if results['xss_vulnerabilities']:
-            xss_file = os.path.join(self.output_dir, 'xss_vulnerabilities.csv')
-            with open(xss_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Type', 'URL', 'Parameter', 'Payload', 'Confidence', 'Evidence'])
-                
-                for vuln in results['xss_vulnerabilities']:
-                    writer.writerow([
-                        vuln.get('type', ''),
-                        vuln.get('url', ''),
-                        vuln.get('parameter', ''),
-                        vuln.get('payload', ''),
-                        vuln.get('confidence', ''),
-                        vuln.get('evidence', '')[:500]
-                    ])
-            
-            print(f"[+] XSS Vulnerabilities CSV generated: {xss_file}")
+        # All sections share one file to avoid per-file open/inode overhead
+        rows = chain.from_iterable(_report_csv_rows(section, items) for section, items in sections)
+        return [('CSV report', os.path.join(self.output_dir, 'report.csv'), REPORT_CSV_HEADER, rows)]
+    
+    def _write_csv(self, filepath: str, header: List[str], rows: Iterable[List[Any]]):
+        """Write a header and all rows to a CSV file in one batch"""
+        if self.use_odirect:
+            self._write_bytes(filepath, _encode_csv(header, rows))
+            return
         
-        # SQLi Vulnerabilities CSV
-        if results['sqli_vulnerabilities']:
-            sqli_file = os.path.join(self.output_dir, 'sqli_vulnerabilities.csv')
-            with open(sqli_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Type', 'Subtype', 'URL', 'Parameter', 'Payload', 'Confidence', 'Database', 'Evidence'])
-                
-                for vuln in results['sqli_vulnerabilities']:
-                    writer.writerow([
-                        vuln.get('type', ''),
-                        vuln.get('subtype', ''),
-                        vuln.get('url', ''),
-                        vuln.get('parameter', ''),
-                        vuln.get('payload', ''),
-                        vuln.get('confidence', ''),
-                        vuln.get('database', ''),
-                        vuln.get('evidence', '')[:500]
-                    ])
-            
-            print(f"[+] SQLi Vulnerabilities CSV generated: {sqli_file}")
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
     
-    def generate_markdown_report(self, results: Dict[str, Any]):
+    def _write_bytes(self, filepath: str, data: bytes):
+        """Write serialized report data, with O_DIRECT when enabled"""
+        if self.use_odirect:
+            try:
+                _write_direct(filepath, data)
+                return
+            except OSError as e:
+                # Filesystems such as tmpfs reject O_DIRECT; use buffered I/O instead
+                if e.errno != errno.EINVAL:
+                    raise
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    
+    def generate_markdown_report(self, results: Dict[str, Any], now: Optional[datetime] = None):
         """Generate Markdown report"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._print_generated(self._write_markdown_report(results, now or datetime.now()))
+    
+    def _write_markdown_report(self, results: Dict[str, Any], now: datetime) -> List[Tuple[str, str]]:
+        """Write the Markdown report to disk"""
+        md_content = self._render_markdown(results, now)
+        
+        # Save to file
+        md_file = os.path.join(self.output_dir, 'report.md')
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write(md_content)
+        
+        return [('Markdown report', md_file)]
+    
+    def _render_markdown(self, results: Dict[str, Any], now: datetime) -> str:
+        """Build the Markdown report content"""
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
         
         # Build directory list
-        dir_list = ""
+        parts = []
+        append = parts.append
         for d in results['directories'][:50]:  # Limit to 50 for readability
-            dir_list += f"- [{d['path']}]({d['url']}) - Status: {d['status']} - Size: {d.get('size', 'N/A')}\n"
+            append(f"- [{urlparse(d['url']).path or '/'}]({d['url']}) - Status: {d['status_code']} - Size: {d.get('content_length', 'N/A')}\n")
+        dir_list = ''.join(parts)
         
-        # Build XSS vulnerabilities
-        xss_list = ""
-        if results['xss_vulnerabilities']:
-            for vuln in results['xss_vulnerabilities']:
-                xss_list += f"### {vuln['type']}\n\n"
-                xss_list += f"- **URL:** {vuln['url']}\n"
-                xss_list += f"- **Parameter:** {vuln.get('parameter', 'N/A')}\n"
-                xss_list += f"- **Payload:** `{vuln['payload']}`\n\n"
-        else:
-            xss_list = "No XSS vulnerabilities found.\n"
+        xss_vulns = results['xss_vulnerabilities']
+        sqli_vulns = results['sqli_vulnerabilities']
         
-        # Build SQLi vulnerabilities
-        sqli_list = ""
-        if results['sqli_vulnerabilities']:
-            for vuln in results['sqli_vulnerabilities']:
-                sqli_list += f"### {vuln['type']}\n\n"
-                sqli_list += f"- **URL:** {vuln['url']}\n"
-                sqli_list += f"- **Parameter:** {vuln.get('parameter', 'N/A')}\n"
-                sqli_list += f"- **Database:** {vuln.get('database', 'Unknown')}\n\n"
+        if not xss_vulns and not sqli_vulns:
+            findings = MD_CLEAN_FINDINGS
         else:
-            sqli_list = "No SQL injection vulnerabilities found.\n"
+            findings = self._render_markdown_findings(xss_vulns, sqli_vulns)
         
-        md_content = f"""# NIDHZ Security Scan Report
+        return f"""# NIDHZ Security Scan Report
 
 ## 📋 Executive Summary
 
@@ -491,9 +496,9 @@ class Reporter:
 | **Target** | `{results['target']}` |
 | **Scan Date** | {timestamp} |
 | **Directories Found** | {len(results['directories'])} |
-| **XSS Vulnerabilities** | {len(results['xss_vulnerabilities'])} |
-| **SQLi Vulnerabilities** | {len(results['sqli_vulnerabilities'])} |
-| **Total Vulnerabilities** | {len(results['xss_vulnerabilities']) + len(results['sqli_vulnerabilities'])} |
+| **XSS Vulnerabilities** | {len(xss_vulns)} |
+| **SQLi Vulnerabilities** | {len(sqli_vulns)} |
+| **Total Vulnerabilities** | {len(xss_vulns) + len(sqli_vulns)} |
 
 ## 🏗️ Technology Stack
 
@@ -505,13 +510,7 @@ Found **{len(results['directories'])}** directories:
 
 {dir_list}
 
-## 🔍 XSS Vulnerabilities
-
-{xss_list}
-
-## 💉 SQL Injection Vulnerabilities
-
-{sqli_list}
+{findings}
 
 ## 📊 Statistics
 
@@ -523,10 +522,35 @@ Found **{len(results['directories'])}** directories:
 
 *Generated by NIDHZ Ultimate v2.0*
 """
+    
+    @staticmethod
+    def _render_markdown_findings(xss_vulns: List[Dict[str, Any]], sqli_vulns: List[Dict[str, Any]]) -> str:
+        """Build the XSS and SQLi sections of the Markdown report"""
+        # Build XSS vulnerabilities
+        if xss_vulns:
+            xss_list = ''.join(
+                f"### {vuln['type']}\n\n"
+                f"- **URL:** {vuln['url']}\n"
+                f"- **Parameter:** {vuln.get('parameter', 'N/A')}\n"
+                f"- **Payload:** `{vuln['payload']}`\n\n"
+                for vuln in xss_vulns
+            )
+        else:
+            xss_list = MD_NO_XSS
         
-        # Save to file
-        md_file = os.path.join(self.output_dir, 'report.md')
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        # Build SQLi vulnerabilities
+        if sqli_vulns:
+            sqli_list = ''.join(
+                f"### {vuln['type']}\n\n"
+                f"- **URL:** {vuln['url']}\n"
+                f"- **Parameter:** {vuln.get('parameter', 'N/A')}\n"
+                f"- **Database:** {vuln.get('database', 'Unknown')}\n\n"
+                for vuln in sqli_vulns
+            )
+        else:
+            sqli_list = MD_NO_SQLI
         
-        print(f"[+] Markdown report generated: {md_file}")
+        return (
+            f"## 🔍 XSS Vulnerabilities\n\n{xss_list}\n\n"
+            f"## 💉 SQL Injection Vulnerabilities\n\n{sqli_list}"
+        )
@@ -244,10 +244,7 @@ class NidhzScanner:
         }
         
         # Generate reports
-        self.reporter.generate_html_report(results_dict)
-        self.reporter.generate_json_report(results_dict)
-        self.reporter.generate_csv_report(results_dict)
-        self.reporter.generate_markdown_report(results_dict)
+        self.reporter.generate_all(results_dict)
         
         print(f"[+] Reports saved to: {self.output_dir}/")
     
@@ -3,12 +3,11 @@ Advanced SQL injection scanner
 """
 
 import re
-import time
 from typing import List, Dict, Optional
 from urllib.parse import urlparse, parse_qs, urlencode
 import logging
 
-from utils.http_client import HTTPClient
+from utils.http_client import HTTPClient, elapsed_seconds
 from utils.wordlist_manager import WordlistManager
 
 
@@ -167,7 +166,7 @@ class SQLiScanner:
             return vulnerabilities
         
         params = parse_qs(parsed.query)
-        baseline_time = baseline.elapsed.total_seconds()
+        baseline_time = elapsed_seconds(baseline)
         
         for param_name in params:
             self.logger.debug(f"Testing time-based SQLi on: {param_name}")
@@ -182,14 +181,13 @@ class SQLiScanner:
                     query=urlencode(test_params, doseq=True)
                 ).geturl()
                 
-                # Measure response time
+                # Measure the server's response time; wall-clock time would also count
+                # client-side rate-limit pauses and report them as injected delays
                 try:
-                    start_time = time.time()
                     response = self.client.get(test_url)
-                    end_time = time.time()
                     
                     if response:
-                        response_time = end_time - start_time
+                        response_time = elapsed_seconds(response)
                         
                         # Check for significant delay
                         if response_time > baseline_time + 5:  # 5 second delay
@@ -0,0 +1,24 @@
+// Add interactivity
+document.addEventListener('DOMContentLoaded', function() {
+    // Toggle vulnerability details
+    document.querySelectorAll('.vuln-card').forEach(card => {
+        card.addEventListener('click', function() {
+            const details = this.querySelector('.vuln-details');
+            if (details) {
+                details.style.display = details.style.display === 'none' ? 'block' : 'none';
+            }
+        });
+    });
+
+    // Copy URLs on click
+    document.querySelectorAll('td:first-child').forEach(td => {
+        td.style.cursor = 'pointer';
+        td.title = 'Click to copy URL';
+        td.addEventListener('click', function() {
+            navigator.clipboard.writeText(this.textContent);
+            const original = this.textContent;
+            this.textContent = 'Copied!';
+            setTimeout(() => this.textContent = original, 1000);
+        });
+    });
+});
@@ -12,7 +12,7 @@ from core.scanner import NidhzScanner
 from core.directory_scanner import DirectoryScanner
 from core.xss_scanner import XSSScanner
 from core.sqli_scanner import SQLiScanner
-from utils.http_client import HTTPClient
+from utils.http_client import HTTPClient, get_default_client
 from utils.wordlist_manager import WordlistManager
 
 
@@ -77,8 +77,8 @@ def custom_vulnerability_scan():
         print("[!] No target provided")
         return
     
-    # Create HTTP client
-    http_client = HTTPClient(timeout=10)
+    # Reuse the shared HTTP client (default settings, 10s timeout)
+    http_client = get_default_client()
     
     # Choose scan type
     print("\nSelect scan type:")
@@ -8,14 +8,204 @@ License: MIT
 
 import sys
 import os
-import argparse
 import time
-from datetime import datetime
-from core.scanner import NidhzScanner
-from utils.helpers import setup_logging, validate_url, print_banner
+from types import SimpleNamespace
+from typing import List, Optional
 
-def main():
-    """Main entry point"""
+# The scanner, helpers and datetime are imported inside the functions that use
+# them, so --version and --help return without loading requests and friends.
+
+
+def run_scan(target: str, output_dir: str, args):
+    """Run a single scan and write its reports to output_dir"""
+    from core.scanner import NidhzScanner
+    from utils.helpers import setup_logging, close_logging, ensure_dir
+    
+    ensure_dir(output_dir)
+    
+    # Setup logging
+    logger = setup_logging(output_dir, args.verbose)
+    
+    # Create scanner instance
+    scanner = NidhzScanner(
+        target=target,
+        mode=args.mode,
+        threads=args.threads,
+        output_dir=output_dir,
+        timeout=args.timeout,
+        user_agent=args.user_agent,
+        proxy=args.proxy,
+        delay=args.delay,
+        retries=args.retries,
+        skip_vuln=args.no_vuln,
+        logger=logger
+    )
+    
+    # Run scan
+    try:
+        scanner.run()
+    except KeyboardInterrupt:
+        logger.warning("Scan interrupted by user")
+        
+        # Save partial results
+        if hasattr(scanner, 'results'):
+            scanner._generate_reports()
+        raise
+    except Exception as e:
+        logger.error(f"Scan failed: {e}")
+        raise
+    finally:
+        scanner.http_client.close()
+        # Daemon mode runs many scans per process; don't leak a log file per target
+        close_logging(logger)
+
+
+def run_daemon(args):
+    """Scan targets read from stdin, one per line, in a single process"""
+    from datetime import datetime
+    from utils.helpers import validate_url, sanitize_filename
+    
+    if args.output:
+        base_dir = args.output
+    else:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        base_dir = f"nidhz_batch_{timestamp}"
+    
+    print("[*] Daemon mode: reading targets from stdin (one per line)")
+    
+    for line in sys.stdin:
+        raw_target = line.strip()
+        if not raw_target or raw_target.startswith('#'):
+            continue
+        
+        try:
+            target = validate_url(raw_target)
+        except ValueError as e:
+            print(f"[!] Skipping {raw_target}: {e}")
+            continue
+        
+        output_dir = os.path.join(base_dir, sanitize_filename(target))
+        print(f"\n[*] Scanning: {target}")
+        
+        try:
+            run_scan(target, output_dir, args)
+        except KeyboardInterrupt:
+            print("\n\n[!] Scan interrupted by user")
+            sys.exit(1)
+        except Exception as e:
+            print(f"\n[!] Error scanning {target}: {e}")
+
+
+SCAN_MODES = ('quick', 'normal', 'deep', 'aggressive')
+
+# Fast-parser defaults; keep in sync with build_parser()
+DEFAULT_ARGS = {
+    'target': None,
+    'mode': 'normal',
+    'threads': 50,
+    'output': None,
+    'no_vuln': False,
+    'timeout': 10,
+    'user_agent': None,
+    'proxy': None,
+    'delay': 0,
+    'retries': 3,
+    'verbose': False,
+    'daemon': False,
+    'version': False
+}
+
+# Option -> (destination, value type); a type of None marks a boolean flag
+FAST_FLAGS = {
+    '-m': ('mode', str),
+    '--mode': ('mode', str),
+    '-t': ('threads', int),
+    '--threads': ('threads', int),
+    '-o': ('output', str),
+    '--output': ('output', str),
+    '--no-vuln': ('no_vuln', None),
+    '--timeout': ('timeout', int),
+    '--user-agent': ('user_agent', str),
+    '--proxy': ('proxy', str),
+    '--delay': ('delay', float),
+    '--retries': ('retries', int),
+    '-v': ('verbose', None),
+    '--verbose': ('verbose', None),
+    '--daemon': ('daemon', None),
+    '--version': ('version', None)
+}
+
+
+def _is_negative_number(value: str) -> bool:
+    """Whether argparse would take value as a negative number rather than an option"""
+    if not value.startswith('-'):
+        return False
+    whole, dot, fraction = value[1:].partition('.')
+    if dot:
+        return (not whole or whole.isdecimal()) and fraction.isdecimal()
+    return whole.isdecimal()
+
+
+def fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command-line shapes without importing argparse
+    
+    Returns None for anything unusual (help, unknown or malformed options)
+    so the caller can fall back to the full argparse parser.
+    """
+    values = dict(DEFAULT_ARGS)
+    index = 0
+    
+    while index < len(argv):
+        arg = argv[index]
+        
+        if arg in ('-h', '--help'):
+            return None
+        
+        if arg.startswith('-') and arg != '-':
+            option, has_value, inline_value = arg.partition('=')
+            spec = FAST_FLAGS.get(option)
+            if spec is None:
+                return None
+            
+            dest, value_type = spec
+            if value_type is None:
+                if has_value:
+                    return None
+                values[dest] = True
+            else:
+                if has_value:
+                    raw_value = inline_value
+                else:
+                    index += 1
+                    if index >= len(argv):
+                        return None
+                    raw_value = argv[index]
+                    # argparse won't take "-o --no-vuln" as output "--no-vuln"
+                    if raw_value.startswith('-') and raw_value != '-' and not _is_negative_number(raw_value):
+                        return None
+                
+                try:
+                    values[dest] = value_type(raw_value)
+                except ValueError:
+                    return None
+        
+        elif values['target'] is None:
+            values['target'] = arg
+        else:
+            return None
+        
+        index += 1
+    
+    if values['mode'] not in SCAN_MODES:
+        return None
+    
+    return SimpleNamespace(**values)
+
+
+def build_parser():
+    """Build the full argparse parser, used for help output and error reporting"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='NIDHZ ULTIMATE - Fastest Web Vulnerability Scanner',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -25,12 +215,13 @@ Examples:
   nidhz.py https://example.com -m deep -t 100    # Deep scan with 100 threads
   nidhz.py https://example.com -o results/       # Save to custom directory
   nidhz.py https://example.com --no-vuln         # Skip vulnerability scanning
+  cat targets.txt | nidhz.py --daemon -o batch/  # Scan many targets in one process
         """
     )
     
     parser.add_argument('target', nargs='?', help='Target URL to scan')
     parser.add_argument('-m', '--mode', 
-                       choices=['quick', 'normal', 'deep', 'aggressive'],
+                       choices=SCAN_MODES,
                        default='normal', 
                        help='Scan mode (default: normal)')
     parser.add_argument('-t', '--threads', 
@@ -61,21 +252,41 @@ Examples:
     parser.add_argument('-v', '--verbose', 
                        action='store_true',
                        help='Verbose output')
+    parser.add_argument('--daemon', 
+                       action='store_true',
+                       help='Read targets from stdin, one per line, and scan them in one process')
     parser.add_argument('--version', 
                        action='store_true',
                        help='Show version')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point"""
+    argv = sys.argv[1:]
+    args = fast_parse_args(argv)
+    if args is None:
+        args = build_parser().parse_args(argv)
     
     # Show version
     if args.version:
         print("NIDHZ Ultimate v2.0")
         return
     
+    from datetime import datetime
+    from utils.helpers import validate_url, print_banner
+    
+    # Batch mode keeps one process (and its compiled templates) for every target
+    if args.daemon:
+        print_banner()
+        run_daemon(args)
+        return
+    
     # Check if target is provided
     if not args.target:
         print("[!] Error: target URL is required")
-        parser.print_help()
+        build_parser().print_help()
         sys.exit(1)
     
     # Validate and normalize URL
@@ -92,43 +303,17 @@ Examples:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_dir = f"nidhz_scan_{timestamp}"
     
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Setup logging
-    logger = setup_logging(output_dir, args.verbose)
-    
     # Print banner
     print_banner()
     
-    # Create scanner instance
-    scanner = NidhzScanner(
-        target=target,
-        mode=args.mode,
-        threads=args.threads,
-        output_dir=output_dir,
-        timeout=args.timeout,
-        user_agent=args.user_agent,
-        proxy=args.proxy,
-        delay=args.delay,
-        retries=args.retries,
-        skip_vuln=args.no_vuln,
-        logger=logger
-    )
-    
     # Run scan
     try:
-        scanner.run()
+        run_scan(target, output_dir, args)
     except KeyboardInterrupt:
         print("\n\n[!] Scan interrupted by user")
-        logger.warning("Scan interrupted by user")
-        
-        # Save partial results
-        if hasattr(scanner, 'results'):
-            scanner.generate_reports(partial=True)
         sys.exit(1)
     except Exception as e:
         print(f"\n[!] Error during scan: {e}")
-        logger.error(f"Scan failed: {e}")
         sys.exit(1)
 
 if __name__ == '__main__':
@@ -1,2 +1,2 @@
 """Utility helpers package"""
-__all__ = ["helpers", "wordlist_manager", "http_client", "progress_bar"]
+__all__ = ["helpers", "wordlist_manager", "http_client", "async_http_client", "progress_bar"]
@@ -0,0 +1,110 @@
+"""
+Asynchronous HTTP client for high-fanout scanning
+"""
+
+import asyncio
+from typing import Optional, Dict, Iterable, List, NamedTuple
+import aiohttp
+
+from utils.http_client import BASE_HEADERS, TokenBucket, random_user_agent
+
+
+class FetchResult(NamedTuple):
+    """Body, status and headers of a completed request"""
+    content: bytes
+    status_code: int
+    headers: Dict[str, str]
+
+
+class AsyncHTTPClient:
+    """Asyncio HTTP client sharing one connection pool across all requests"""
+
+    def __init__(self,
+                 timeout: int = 10,
+                 user_agent: Optional[str] = None,
+                 proxy: Optional[str] = None,
+                 delay: float = 0,
+                 verify_ssl: bool = False,
+                 limit: int = 1024,
+                 limit_per_host: int = 64,
+                 read_bufsize: int = 4 * 1024 * 1024):
+
+        self.timeout = timeout
+        self.proxy = proxy
+        self.delay = delay
+        self._bucket = TokenBucket(rate=1 / delay, capacity=1) if delay > 0 else None
+        self.verify_ssl = verify_ssl
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.read_bufsize = read_bufsize
+        self.headers = dict(BASE_HEADERS)
+        self.headers['User-Agent'] = user_agent or random_user_agent()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'AsyncHTTPClient':
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Build the session on first use (it must be created inside the event loop)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ssl=self.verify_ssl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+                read_bufsize=self.read_bufsize,
+                auto_decompress=True
+            )
+        return self._session
+
+    async def get(self, url: str, **kwargs) -> Optional[FetchResult]:
+        """Send GET request"""
+        return await self._request('GET', url, **kwargs)
+
+    async def post(self, url: str, data: Optional[Dict] = None, **kwargs) -> Optional[FetchResult]:
+        """Send POST request"""
+        return await self._request('POST', url, data=data, **kwargs)
+
+    async def _request(self, method: str, url: str, **kwargs) -> Optional[FetchResult]:
+        """Send HTTP request, returning None on network errors"""
+        if self._bucket:
+            # Each task reserves its slot up front, then sleeps without blocking the loop
+            wait = self._bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        kwargs.setdefault('proxy', self.proxy)
+
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                body = await response.read()
+                return FetchResult(body, response.status, dict(response.headers))
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    async def batch(self, urls: Iterable[str], method: str = 'GET', **kwargs) -> List[Optional[FetchResult]]:
+        """Fetch all URLs concurrently, preserving input order"""
+        return await asyncio.gather(*(self._request(method, url, **kwargs) for url in urls))
+
+    async def close(self):
+        """Close the session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def fetch_all(urls: Iterable[str], method: str = 'GET', **client_kwargs) -> List[Optional[FetchResult]]:
+    """Blocking wrapper that fetches URLs concurrently on a private event loop"""
+    async def _run():
+        async with AsyncHTTPClient(**client_kwargs) as client:
+            return await client.batch(urls, method)
+
+    return asyncio.run(_run())
@@ -12,6 +12,18 @@ import re
 from urllib.parse import urlparse
 
 
+# Directories this process has already created
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(path: str) -> str:
+    """Create a directory, skipping the syscalls if it was already created"""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
 def setup_logging(output_dir: str, verbose: bool = False) -> logging.Logger:
     """Setup logging configuration"""
     log_file = os.path.join(output_dir, 'scan.log')
@@ -42,6 +54,13 @@ def setup_logging(output_dir: str, verbose: bool = False) -> logging.Logger:
     return logger
 
 
+def close_logging(logger: logging.Logger):
+    """Detach and close the handlers installed by setup_logging"""
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+
 def validate_url(url: str) -> str:
     """Validate and normalize URL"""
     if not url:
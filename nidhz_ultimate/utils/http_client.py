@@ -3,11 +3,416 @@ Optimized HTTP client for maximum performance
 """
 
 import time
+import json
 import random
-from typing import Optional, Dict, Any
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import socket
+import atexit
+import functools
+import logging
+import threading
+import weakref
+from types import MappingProxyType
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlparse, urlsplit
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Iterable, Iterator, List, TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+# requests/urllib3 (or httpx) are imported on first HTTPClient() so importing this module stays cheap
+if TYPE_CHECKING:
+    import requests
+
+
+logger = logging.getLogger(__name__)
+
+# Chunk size for streaming request bodies (urllib3 v2 only); responses are read independently of it
+SOCKET_BLOCKSIZE = 128 * 1024
+DEFAULT_POOL_SIZE = 100
+# Pooled connections idle longer than this are likely closed by the server already
+MAX_IDLE_SECONDS = 90
+# Upper bound on how long a server's rate-limit headers can pause a host
+MAX_RATE_LIMIT_WAIT = 300
+
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "POST", "PUT", "DELETE"})
+
+_UA_POOL = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0'
+)
+
+
+def random_user_agent() -> str:
+    """Pick a browser user agent from the pool"""
+    return random.choice(_UA_POOL)
+
+
+# Headers sent with every request; User-Agent and Accept-Encoding are added per client
+BASE_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+})
+
+
+def elapsed_seconds(response: Optional['requests.Response']) -> Optional[float]:
+    """Round-trip time of a response in seconds"""
+    return response.elapsed.total_seconds() if response is not None else None
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Encode a JSON request body"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _rate_limit_wait(response, check_retry_after: bool = True) -> float:
+    """Seconds the server asked us to wait, from Retry-After or X-RateLimit-* headers"""
+    headers = response.headers
+    if check_retry_after and response.status_code in (429, 503):
+        value = headers.get('Retry-After')
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+            try:
+                return parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return 0.0
+    
+    if headers.get('X-RateLimit-Remaining') == '0':
+        try:
+            reset = float(headers.get('X-RateLimit-Reset', ''))
+        except ValueError:
+            return 0.0
+        # Some servers send an epoch timestamp, others a delay in seconds
+        return reset - time.time() if reset > 1e9 else reset
+    
+    return 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _disable_warnings():
+    """Silence urllib3's insecure-request warnings once per process"""
+    import urllib3
+    urllib3.disable_warnings()
+
+
+_system_getaddrinfo = socket.getaddrinfo
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_getaddrinfo(host, port, family, type, proto, flags):
+    return _system_getaddrinfo(host, port, family, type, proto, flags)
+
+
+def _getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo replacement that answers repeat lookups from memory"""
+    return list(_cached_getaddrinfo(host, port, family, type, proto, flags))
+
+
+@functools.lru_cache(maxsize=None)
+def _install_dns_cache():
+    """Route the process's name lookups through the cache (failures are not cached)"""
+    socket.getaddrinfo = _getaddrinfo
+
+
+class TokenBucket:
+    """Thread-safe token bucket enforcing a global request rate"""
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _RequestsBackend:
+    """requests/urllib3 transport with pooled, retrying adapters"""
+    
+    _initialized = False
+    
+    @classmethod
+    def _load(cls):
+        """Import requests/urllib3 and build the adapter class on first use"""
+        if cls._initialized:
+            return
+        
+        import requests
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+        
+        # urllib3 v2 accepts a connection blocksize, which only sizes request-body upload chunks
+        urllib3_v2 = int(urllib3.__version__.split('.')[0]) >= 2
+        
+        class IdleCapMixin:
+            """Connection pool that reconnects instead of reusing long-idle sockets"""
+            
+            def _get_conn(self, timeout=None):
+                conn = super()._get_conn(timeout)
+                idle_since = getattr(conn, '_idle_since', None)
+                if idle_since is not None and time.monotonic() - idle_since > MAX_IDLE_SECONDS:
+                    conn.close()  # reconnects transparently on next use
+                return conn
+            
+            def _put_conn(self, conn):
+                if conn is not None:
+                    conn._idle_since = time.monotonic()
+                super()._put_conn(conn)
+        
+        pool_classes = {
+            'http': type('IdleCapHTTPConnectionPool', (IdleCapMixin, HTTPConnectionPool), {}),
+            'https': type('IdleCapHTTPSConnectionPool', (IdleCapMixin, HTTPSConnectionPool), {})
+        }
+        
+        class BigBlockAdapter(HTTPAdapter):
+            """HTTPAdapter uploading bodies in SOCKET_BLOCKSIZE chunks over idle-capped pools"""
+            
+            def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+                if urllib3_v2:
+                    pool_kwargs['blocksize'] = SOCKET_BLOCKSIZE
+                super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+                self.poolmanager.pool_classes_by_scheme = pool_classes
+            
+            def proxy_manager_for(self, proxy, **proxy_kwargs):
+                if urllib3_v2:
+                    proxy_kwargs['blocksize'] = SOCKET_BLOCKSIZE
+                manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+                manager.pool_classes_by_scheme = pool_classes
+                return manager
+        
+        class LenientSession(requests.Session):
+            """Session whose unfollowed-redirect lookahead tolerates a malformed Location"""
+            
+            def resolve_redirects(self, *args, **kwargs):
+                # send() parses Location to fill response.next even with allow_redirects=False
+                try:
+                    yield from super().resolve_redirects(*args, **kwargs)
+                except ValueError:
+                    return
+        
+        cls._session_class = LenientSession
+        cls._Retry = Retry
+        # Everything a request can raise: requests errors, urllib3 errors while
+        # reading a streamed body, and raw socket errors
+        cls.errors = (requests.RequestException, urllib3.exceptions.HTTPError, OSError)
+        cls._adapter_class = BigBlockAdapter
+        cls._urllib3_v2 = urllib3_v2
+        # gzip/deflate plus br and zstd when their decoders are installed
+        cls._accept_encoding = ACCEPT_ENCODING
+        _disable_warnings()
+        cls._initialized = True
+    
+    def __init__(self, headers: Dict[str, str], proxy: Optional[str], retries: int):
+        self._load()
+        
+        # Create session with optimized settings
+        self.session = self._session_class()
+        
+        # Configure retry strategy; connect, read and status failures each get their own budget
+        retry_kwargs = {'backoff_jitter': 0.3} if self._urllib3_v2 else {}
+        self._retry_strategy = self._Retry(
+            total=retries * 2,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **retry_kwargs
+        )
+        self.mount_adapters(DEFAULT_POOL_SIZE)
+        
+        self.session.headers.update(headers)
+        self.session.headers['Accept-Encoding'] = self._accept_encoding
+        
+        # Set proxy if provided
+        if proxy:
+            self.session.proxies = {
+                'http': proxy,
+                'https': proxy
+            }
+    
+    def mount_adapters(self, pool_size: int):
+        """Mount pooled adapters holding up to pool_size connections per host"""
+        adapter = self._adapter_class(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=self._retry_strategy,
+            pool_block=False
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool_size = pool_size
+    
+    def ensure_pool(self, workers: int):
+        """Grow the pool so concurrent workers don't open throwaway connections"""
+        if workers > self.pool_size:
+            self.mount_adapters(max(DEFAULT_POOL_SIZE, workers * 2))
+    
+    def request(self, method: str, url: str, max_body_bytes: int, **kwargs) -> 'requests.Response':
+        """Send a request, reading at most max_body_bytes unless stream is given"""
+        limit_body = 'stream' not in kwargs and max_body_bytes > 0
+        if limit_body:
+            kwargs['stream'] = True
+        
+        response = self.session.request(method, url, **kwargs)
+        if limit_body:
+            self._read_body(response, max_body_bytes)
+        return response
+    
+    @staticmethod
+    def slept_on_retry_after(response: 'requests.Response') -> bool:
+        """Whether urllib3 already waited out a Retry-After while retrying this request"""
+        retries = getattr(response.raw, 'retries', None)
+        return bool(retries and any(entry.status in (429, 503) for entry in retries.history))
+    
+    def _read_body(self, response: 'requests.Response', max_body_bytes: int):
+        """Load at most max_body_bytes of a streamed body and flag truncation"""
+        body = response.raw.read(max_body_bytes + 1, decode_content=True)
+        response.truncated = len(body) > max_body_bytes
+        response._content = body[:max_body_bytes]
+        response._content_consumed = True
+        if response.truncated:
+            # Drop the connection rather than draining the rest of the body
+            response.close()
+        else:
+            response.raw.release_conn()
+    
+    def set_header(self, name: str, value: str):
+        """Change a header sent with every request"""
+        self.session.headers[name] = value
+    
+    def close(self):
+        """Close the session"""
+        self.session.close()
+
+
+class _HttpxResponse:
+    """requests.Response-compatible view of an httpx.Response, as the scanners expect"""
+    
+    def __init__(self, response):
+        self._response = response
+    
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+    
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+    
+    @property
+    def ok(self) -> bool:
+        return self._response.status_code < 400
+    
+    def __bool__(self) -> bool:
+        # Like requests, 4xx/5xx responses are falsy so `if response:` skips error pages
+        return self.ok
+
+
+class _HttpxBackend:
+    """httpx transport, multiplexing requests over HTTP/2 where the server allows it"""
+    
+    def __init__(self,
+                 headers: Dict[str, str],
+                 proxy: Optional[str],
+                 retries: int,
+                 timeout: int,
+                 verify_ssl: bool,
+                 http2: bool):
+        import httpx
+        
+        self.errors = (httpx.HTTPError, httpx.StreamError, httpx.InvalidURL, OSError)
+        # Connection-specific headers are illegal on HTTP/2, and httpx
+        # advertises the encodings its own decoders support
+        headers = {k: v for k, v in headers.items() if k not in ('Connection', 'Accept-Encoding')}
+        
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            verify=verify_ssl,
+            proxy=proxy,
+            retries=retries,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_POOL_SIZE,
+                max_keepalive_connections=DEFAULT_POOL_SIZE,
+                keepalive_expiry=MAX_IDLE_SECONDS
+            )
+        )
+        self.client = httpx.Client(transport=transport, timeout=timeout, headers=headers)
+    
+    def ensure_pool(self, workers: int):
+        """Connection limits are fixed when the httpx client is built"""
+    
+    def request(self, method: str, url: str, max_body_bytes: int, **kwargs):
+        """Send a request, accepting requests-style keyword arguments"""
+        follow_redirects = kwargs.pop('allow_redirects', True)
+        kwargs.pop('verify', None)  # fixed per client in httpx
+        stream = kwargs.pop('stream', None)
+        if isinstance(kwargs.get('data'), (bytes, str)):
+            kwargs['content'] = kwargs.pop('data')  # httpx takes raw bodies as content=
+        
+        if stream:
+            request = self.client.build_request(method, url, **kwargs)
+            return _HttpxResponse(self.client.send(request, stream=True, follow_redirects=follow_redirects))
+        
+        if stream is False or max_body_bytes <= 0:
+            return _HttpxResponse(self.client.request(method, url, follow_redirects=follow_redirects, **kwargs))
+        
+        # Closing the stream early drops the connection (or resets the HTTP/2 stream)
+        with self.client.stream(method, url, follow_redirects=follow_redirects, **kwargs) as response:
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body += chunk
+                if len(body) > max_body_bytes:
+                    break
+        response.truncated = len(body) > max_body_bytes
+        response._content = bytes(body[:max_body_bytes])
+        return _HttpxResponse(response)
+    
+    @staticmethod
+    def slept_on_retry_after(response) -> bool:
+        """httpx's transport never honours Retry-After itself"""
+        return False
+    
+    def set_header(self, name: str, value: str):
+        """Change a header sent with every request"""
+        self.client.headers[name] = value
+    
+    def close(self):
+        """Close the client"""
+        self.client.close()
 
 
 class HTTPClient:
@@ -19,109 +424,209 @@ class HTTPClient:
                  proxy: Optional[str] = None,
                  delay: float = 0,
                  retries: int = 3,
-                 verify_ssl: bool = False):
+                 verify_ssl: bool = False,
+                 max_body_bytes: int = 2 << 20,
+                 backend: str = "requests",
+                 http2: bool = False,
+                 follow_redirects: bool = True,
+                 max_redirects: int = 5,
+                 same_host_only: bool = True,
+                 per_host_limit: int = 0,
+                 async_mode: bool = False,
+                 async_workers: int = 64):
         
         self.timeout = timeout
         self.delay = delay
+        # delay is the minimum interval between requests across all threads
+        self._bucket = TokenBucket(rate=1 / delay, capacity=1) if delay > 0 else None
         self.retries = retries
         self.verify_ssl = verify_ssl
+        # Bodies are read up to this many bytes unless the caller passes stream explicitly
+        self.max_body_bytes = max_body_bytes
+        # Redirects are followed here rather than by the backend, so hops stay capped
+        # and on the target's host
+        self.follow_redirects = follow_redirects
+        self.max_redirects = max_redirects
+        self.same_host_only = same_host_only
+        # Optional cap on requests in flight to any one host; off by default so the
+        # caller's own thread count decides the concurrency
+        self.per_host_limit = per_host_limit
+        self._host_sems: Dict[str, threading.Semaphore] = {}
+        self._host_sems_lock = threading.Lock()
+        # Monotonic time before which a rate-limited host should not be contacted
+        self._host_blocked_until: Dict[str, float] = {}
         
-        # Create session with optimized settings
-        self.session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=retries,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "HEAD"]
-        )
-        
-        # Create adapter with connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=100,
-            pool_maxsize=100,
-            max_retries=retry_strategy,
-            pool_block=False
-        )
-        
-        # Mount adapters
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
-        
-        # Set default headers
-        default_headers = {
-            'User-Agent': user_agent or self._get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0'
-        }
+        # Set default headers; the user agent stays fixed until rotate_user_agent()
+        self.user_agent = user_agent or random_user_agent()
+        headers = dict(BASE_HEADERS)
+        headers['User-Agent'] = self.user_agent
         
-        self.session.headers.update(default_headers)
+        _install_dns_cache()
+        if backend == "requests":
+            self._backend = _RequestsBackend(headers, proxy, retries)
+        elif backend == "httpx":
+            self._backend = _HttpxBackend(headers, proxy, retries, timeout, verify_ssl, http2)
+        else:
+            raise ValueError(f"Unknown HTTP backend: {backend}")
         
-        # Set proxy if provided
-        if proxy:
-            self.session.proxies = {
-                'http': proxy,
-                'https': proxy
-            }
+        # In async mode get()/post() return Futures resolved on this pool
+        self._executor = None
+        if async_mode:
+            self._backend.ensure_pool(async_workers)
+            self._executor = ThreadPoolExecutor(max_workers=async_workers, thread_name_prefix='http')
         
-        # Disable SSL warnings for speed
-        requests.packages.urllib3.disable_warnings()
-    
-    def _get_random_user_agent(self) -> str:
-        """Get random user agent"""
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0'
-        ]
-        return random.choice(user_agents)
-    
-    def get(self, url: str, **kwargs) -> Optional[requests.Response]:
+        # Release pooled sockets even if the caller never calls close()
+        self._finalizer = weakref.finalize(self, self._backend.close)
+    
+    def __enter__(self) -> 'HTTPClient':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def rotate_user_agent(self) -> str:
+        """Switch this client to a new user agent from the pool"""
+        self.user_agent = random_user_agent()
+        self._backend.set_header('User-Agent', self.user_agent)
+        return self.user_agent
+    
+    def get(self, url: str, **kwargs) -> Optional['requests.Response']:
         """Send GET request with optimized settings"""
-        return self._request('GET', url, **kwargs)
+        return self._dispatch('GET', url, **kwargs)
+    
+    def get_many(self, urls: Iterable[str], max_workers: int = 32, **kwargs) -> List[Optional['requests.Response']]:
+        """Send GET requests concurrently over the shared connection pool, preserving input order"""
+        self._backend.ensure_pool(max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda url: self._request('GET', url, **kwargs), urls))
     
-    def post(self, url: str, data: Optional[Dict] = None, **kwargs) -> Optional[requests.Response]:
+    def post(self, url: str, data: Optional[Dict] = None, **kwargs) -> Optional['requests.Response']:
         """Send POST request with optimized settings"""
-        return self._request('POST', url, data=data, **kwargs)
+        body = kwargs.pop('json', None)
+        if body is not None and data is None:
+            # Encode json= ourselves so orjson is used when available
+            data = _dumps_json(body)
+            headers = dict(kwargs.get('headers') or {})
+            if not any(name.lower() == 'content-type' for name in headers):
+                headers['Content-Type'] = 'application/json'
+            kwargs['headers'] = headers
+        return self._dispatch('POST', url, data=data, **kwargs)
     
-    def _request(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
-        """Send HTTP request with error handling and delay"""
-        # Apply delay if configured
-        if self.delay > 0:
-            time.sleep(self.delay)
-        
-        # Set default parameters
+    @staticmethod
+    def gather(futures: Iterable[Future]) -> Iterator[Optional['requests.Response']]:
+        """Yield the responses of async-mode requests as they complete"""
+        for future in as_completed(futures):
+            yield future.result()
+    
+    def _dispatch(self, method: str, url: str, **kwargs):
+        """Run the request now, or hand it to the pool in async mode"""
+        if self._executor is not None:
+            return self._executor.submit(self._request, method, url, **kwargs)
+        return self._request(method, url, **kwargs)
+    
+    def _request(self, method: str, url: str, **kwargs) -> Optional['requests.Response']:
+        """Send HTTP request with error handling and rate limiting"""
+        # Set default parameters; follow_redirects or allow_redirects override the client setting
+        follow = kwargs.pop('allow_redirects', self.follow_redirects)
+        follow = kwargs.pop('follow_redirects', follow)
+        kwargs['allow_redirects'] = False
         kwargs.setdefault('timeout', self.timeout)
-        kwargs.setdefault('allow_redirects', True)
         kwargs.setdefault('verify', self.verify_ssl)
-        kwargs.setdefault('stream', False)
         
         try:
-            response = self.session.request(method, url, **kwargs)
-            if hasattr(response, 'elapsed'):
-                response.elapsed = response.elapsed.total_seconds()
+            response = self._send(method, url, kwargs)
+            if follow:
+                response = self._follow(response, method, kwargs)
             return response
         
-        except requests.exceptions.Timeout:
-            return None
-        except requests.exceptions.ConnectionError:
-            return None
-        except requests.exceptions.TooManyRedirects:
-            return None
-        except requests.exceptions.RequestException as e:
-            # Catch all requests-related exceptions
-            return None
-        except Exception as e:
-            # Unexpected error - log if needed
+        except self._backend.errors:
+            logger.debug("%s %s failed", method, url, exc_info=True)
             return None
     
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]):
+        """Send one request through the backend under the rate and per-host limits"""
+        host = urlsplit(url).netloc
+        blocked_until = self._host_blocked_until.get(host)
+        if blocked_until is not None:
+            wait = blocked_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        
+        if self._bucket:
+            self._bucket.acquire()
+        
+        if self.per_host_limit:
+            sem = self._host_sems.get(host)
+            if sem is None:
+                with self._host_sems_lock:
+                    sem = self._host_sems.setdefault(host, threading.Semaphore(self.per_host_limit))
+            with sem:
+                response = self._backend.request(method, url, self.max_body_bytes, **kwargs)
+        else:
+            response = self._backend.request(method, url, self.max_body_bytes, **kwargs)
+        
+        # Don't stack a host pause on Retry-After sleeps urllib3 already took for this call
+        wait = _rate_limit_wait(response, not self._backend.slept_on_retry_after(response))
+        if wait > 0:
+            self._host_blocked_until[host] = time.monotonic() + min(wait, MAX_RATE_LIMIT_WAIT)
+        return response
+    
+    def _follow(self, response, method: str, kwargs: Dict[str, Any]):
+        """Follow up to max_redirects hops, stopping early at a redirect off the current host"""
+        for _ in range(self.max_redirects):
+            if not response.is_redirect:
+                break
+            
+            current = str(response.url)
+            try:
+                location = urljoin(current, response.headers['Location'])
+                off_host = urlparse(location).netloc != urlparse(current).netloc
+            except ValueError:
+                # Malformed Location (e.g. "http://[bad/"): hand back the redirect itself
+                break
+            if self.same_host_only and off_host:
+                break
+            
+            # Like browsers, turn POSTs into GETs except on 307/308
+            kwargs.pop('params', None)
+            if response.status_code == 303 or (response.status_code in (301, 302) and method == 'POST'):
+                method = 'GET'
+                for key in ('data', 'json', 'files'):
+                    kwargs.pop(key, None)
+            
+            response.close()
+            response = self._send(method, location, kwargs)
+        
+        return response
+    
+    @staticmethod
+    def clear_dns_cache():
+        """Forget cached name lookups, e.g. after a target changes address"""
+        _cached_getaddrinfo.cache_clear()
+    
     def close(self):
-        """Close the session"""
-        self.session.close()
+        """Close the underlying connection pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._finalizer()
+
+
+_DEFAULT_CLIENT: Optional[HTTPClient] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """Return the shared HTTPClient (default settings; build your own HTTPClient for custom ones)"""
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = HTTPClient()
+    return _DEFAULT_CLIENT
+
+
+@atexit.register
+def _close_default_client():
+    if _DEFAULT_CLIENT is not None:
+        _DEFAULT_CLIENT.close()